@@ -3,15 +3,20 @@
 from __future__ import annotations as _annotations
 
 import inspect
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Sequence
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from functools import cache, cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, get_args
 
 import pydantic_core
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import PromptArgument as MCPPromptArgument
 from mcp.types import PromptMessage, Role, TextContent
-from pydantic import Field, TypeAdapter, validate_call
+from pydantic import ConfigDict, Field, PrivateAttr, TypeAdapter, ValidationError
+from pydantic.dataclasses import dataclass
+from pydantic.fields import FieldInfo
+from typing_extensions import Self
 
 from fastmcp.exceptions import PromptError
 from fastmcp.server.dependencies import get_context
@@ -19,28 +24,69 @@ from fastmcp.utilities.components import FastMCPComponent
 from fastmcp.utilities.json_schema import compress_schema
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import (
-    FastMCPBaseModel,
     MCPContent,
     find_kwarg_by_type,
     get_cached_typeadapter,
 )
 
 if TYPE_CHECKING:
-    pass
+    from fastmcp.server.context import Context
 
 
 logger = get_logger(__name__)
 
 
+@cache
+def _context_type() -> type[Context]:
+    """The Context class, imported on first use to avoid a circular import."""
+    from fastmcp.server.context import Context
+
+    return Context
+
+
+# Fields of a Prompt that feed into its MCP representation
+_MCP_PROMPT_FIELDS = frozenset({"name", "description", "arguments"})
+
+
+# Messages built from strings we already hold, or from content models that were
+# validated when they were created, are valid by construction, so they skip
+# Pydantic validation. Set to False to validate them anyway.
+_TRUST_INTERNAL = True
+
+_ROLES = get_args(Role)
+
+# Bound once, as building text messages is the most common conversion
+_construct_message = PromptMessage.model_construct
+_construct_text = TextContent.model_construct
+
+
+def _text_message(text: str, role: Role = "user") -> PromptMessage:
+    """Build a text PromptMessage from a plain string, not a str subclass."""
+    if _TRUST_INTERNAL:
+        return _construct_message(
+            role=role, content=_construct_text(type="text", text=text)
+        )
+    return PromptMessage(role=role, content=TextContent(type="text", text=text))
+
+
 def Message(
     content: str | MCPContent, role: Role | None = None, **kwargs: Any
 ) -> PromptMessage:
     """A user-friendly constructor for PromptMessage."""
-    if isinstance(content, str):
-        content = TextContent(type="text", text=content)
     if role is None:
         role = "user"
-    return PromptMessage(content=content, role=role, **kwargs)
+    # Plain text or already-validated content with a known role can't produce an
+    # invalid message, so only extra fields or other content are validated
+    if not kwargs and role in _ROLES:
+        if type(content) is str:
+            return _text_message(content, role=role)
+        if _TRUST_INTERNAL and isinstance(content, MCPContent):
+            return _construct_message(role=role, content=content)
+    if isinstance(content, str):
+        content = TextContent(type="text", text=content)
+    return message_validator.validate_python(
+        {"content": content, "role": role, **kwargs}
+    )
 
 
 message_validator = TypeAdapter[PromptMessage](PromptMessage)
@@ -54,8 +100,57 @@ SyncPromptResult = (
 PromptResult = SyncPromptResult | Awaitable[SyncPromptResult]
 
 
-class PromptArgument(FastMCPBaseModel):
-    """An argument that can be passed to a prompt."""
+def _json_to_message(msg: Any) -> PromptMessage:
+    """Serialize an arbitrary object into a text PromptMessage."""
+    return _text_message(pydantic_core.to_json(msg, fallback=str).decode())
+
+
+def _dict_to_message(msg: dict[str, Any]) -> PromptMessage:
+    """
+    Validate a dict with a role and content as a PromptMessage, and serialize
+    any other dict, or one that isn't a valid message, into a text PromptMessage.
+    """
+    if "role" in msg and "content" in msg:
+        try:
+            return message_validator.validate_python(msg)
+        except ValidationError:
+            pass
+    return _json_to_message(msg)
+
+
+def _convert_to_message(msg: Any) -> PromptMessage:
+    """Convert a single item of a prompt function's result to a PromptMessage."""
+    if isinstance(msg, PromptMessage):
+        return msg
+    if isinstance(msg, str):
+        # Validating normalizes str subclasses, such as str enums, to str
+        return PromptMessage(role="user", content=TextContent(type="text", text=msg))
+    if isinstance(msg, dict):
+        return _dict_to_message(msg)
+    if inspect.iscoroutine(msg):
+        msg.close()
+        raise PromptError("Prompt messages must not be coroutines; await them first")
+    return _json_to_message(msg)
+
+
+# Converters for the exact types prompt functions usually return, so that
+# converting a result is a dict lookup rather than a chain of isinstance checks.
+# Anything else, including subclasses, goes through _convert_to_message.
+_MESSAGE_CONVERTERS: dict[type, Callable[[Any], PromptMessage]] = {
+    PromptMessage: lambda msg: msg,
+    str: _text_message,
+    dict: _dict_to_message,
+}
+
+
+@dataclass(frozen=True, slots=True, config=ConfigDict(extra="forbid"))
+class PromptArgument:
+    """
+    An argument that can be passed to a prompt.
+
+    Prompts can have many arguments, so this is a slotted, frozen dataclass
+    rather than a model to keep instances small and hashable.
+    """
 
     name: str = Field(description="Name of the argument")
     description: str | None = Field(
@@ -69,10 +164,31 @@ class PromptArgument(FastMCPBaseModel):
 class Prompt(FastMCPComponent, ABC):
     """A prompt template that can be rendered with parameters."""
 
-    arguments: list[PromptArgument] | None = Field(
+    arguments: tuple[PromptArgument, ...] | None = Field(
         default=None, description="Arguments that can be passed to the prompt"
     )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _MCP_PROMPT_FIELDS:
+            self.__dict__.pop("_mcp_prompt_base", None)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not _MCP_PROMPT_FIELDS.isdisjoint(update):
+            copied.__dict__.pop("_mcp_prompt_base", None)
+        return copied
+
+    @cached_property
+    def _mcp_prompt_base(self) -> MCPPrompt:
+        """
+        The MCP prompt without overrides. It is rebuilt when the name,
+        description or arguments are reassigned.
+        """
+        return self.to_mcp_prompt()
+
     def to_mcp_prompt(self, **overrides: Any) -> MCPPrompt:
         """Convert the prompt to an MCP prompt."""
         arguments = [
@@ -81,7 +197,7 @@ class Prompt(FastMCPComponent, ABC):
                 description=arg.description,
                 required=arg.required,
             )
-            for arg in self.arguments or []
+            for arg in self.arguments or ()
         ]
         kwargs = {
             "name": self.name,
@@ -90,6 +206,15 @@ class Prompt(FastMCPComponent, ABC):
         }
         return MCPPrompt(**kwargs | overrides)
 
+    def _to_listed_mcp_prompt(self, name: str) -> MCPPrompt:
+        """
+        The MCP prompt the server lists under name. It is cached while name is
+        the prompt's own name, so the result is shared and must not be mutated.
+        """
+        if name == self.name:
+            return self._mcp_prompt_base
+        return self.to_mcp_prompt(name=name)
+
     @staticmethod
     def from_function(
         fn: Callable[..., PromptResult | Awaitable[PromptResult]],
@@ -103,11 +228,16 @@ class Prompt(FastMCPComponent, ABC):
         The function can return:
         - A string (converted to a message)
         - A Message object
-        - A dict (converted to a message)
+        - A dict (a valid PromptMessage dict with a role and content is used as
+          that message, any other dict is serialized to JSON as a text message)
         - A sequence of any of the above
         """
         return FunctionPrompt.from_function(
-            fn=fn, name=name, description=description, tags=tags, enabled=enabled
+            fn=fn,
+            name=name,
+            description=description,
+            tags=tags,
+            enabled=enabled,
         )
 
     @abstractmethod
@@ -119,11 +249,162 @@ class Prompt(FastMCPComponent, ABC):
         raise NotImplementedError("Prompt.render() must be implemented by subclasses")
 
 
+class _IntrospectedFunction(NamedTuple):
+    """The parts of a prompt function that don't depend on registration options."""
+
+    func_name: str
+    description: str | None
+    arguments: tuple[PromptArgument, ...]
+    context_kwarg: str | None
+
+
+def _unwrap_fn(
+    fn: Callable[..., PromptResult | Awaitable[PromptResult]],
+) -> Callable[..., PromptResult | Awaitable[PromptResult]]:
+    """The function to call for fn, which may be a callable class or staticmethod."""
+    # if the fn is a callable class, we need to get the __call__ method from here out
+    if not inspect.isroutine(fn):
+        fn = fn.__call__
+    # if the fn is a staticmethod, we need to work with the underlying function
+    if isinstance(fn, staticmethod):
+        fn = fn.__func__
+    return fn
+
+
+@lru_cache(maxsize=5000)
+def _introspect_fn(
+    fn: Callable[..., PromptResult | Awaitable[PromptResult]],
+) -> _IntrospectedFunction:
+    """
+    Inspecting a function's signature, generating and compressing its schema and
+    turning that into arguments is expensive, and the result only depends on the
+    function itself (the pruned parameters are derived from it). Caching it
+    makes re-registering the same function (hot reload, repeated mounts, test
+    suites) a cache lookup that hands back the same argument objects.
+
+    The cache compares functions by equality, so callables that are equal but
+    distinct share an entry. It therefore doesn't hold the callable itself,
+    which callers unwrap from their own fn.
+    """
+    func_name = getattr(fn, "__name__", None) or fn.__class__.__name__
+
+    # Reject functions with *args or **kwargs
+    sig = inspect.signature(fn)
+    for param in sig.parameters.values():
+        if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            raise ValueError("Functions with *args are not supported as prompts")
+        if param.kind == inspect.Parameter.VAR_KEYWORD:
+            raise ValueError("Functions with **kwargs are not supported as prompts")
+
+    description = inspect.getdoc(fn)
+
+    fn = _unwrap_fn(fn)
+
+    type_adapter = get_cached_typeadapter(fn)
+    parameters = type_adapter.json_schema()
+
+    # Auto-detect context parameter if not provided
+
+    context_kwarg = find_kwarg_by_type(fn, kwarg_type=_context_type())
+    if context_kwarg:
+        prune_params = [context_kwarg]
+    else:
+        prune_params = None
+
+    parameters = compress_schema(parameters, prune_params=prune_params)
+
+    # Convert parameters to PromptArguments
+    arguments: list[PromptArgument] = []
+    if "properties" in parameters:
+        for param_name, param in parameters["properties"].items():
+            arguments.append(
+                PromptArgument(
+                    name=sys.intern(param_name),
+                    description=param.get("description"),
+                    required=param_name in parameters.get("required", []),
+                )
+            )
+
+    return _IntrospectedFunction(
+        func_name=func_name,
+        description=description,
+        arguments=tuple(arguments),
+        context_kwarg=context_kwarg,
+    )
+
+
+def _returns_awaitable(fn: Callable[..., Any]) -> bool | None:
+    """
+    Whether calling fn returns an awaitable, or None if that can't be known
+    until it is called, e.g. for wrappers that may return a coroutine.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return True
+    if (inspect.isfunction(fn) or inspect.ismethod(fn)) and not hasattr(
+        fn, "__wrapped__"
+    ):
+        return False
+    return None
+
+
+def _takes_plain_strings(fn: Callable[..., Any]) -> bool:
+    """
+    Whether every parameter of fn is a keyword-compatible `str` without a
+    Pydantic field default, so that string arguments can be passed to it as-is.
+    """
+    for param in inspect.signature(fn).parameters.values():
+        if param.kind not in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        ):
+            return False
+        if param.annotation not in (str, "str"):
+            return False
+        if isinstance(param.default, FieldInfo):
+            return False
+    return True
+
+
+# The FunctionPrompt fields its precomputed private attributes depend on
+_PRECOMPUTED_FROM_FIELDS = frozenset({"fn", "arguments"})
+
+
 class FunctionPrompt(Prompt):
     """A prompt that is a function."""
 
     fn: Callable[..., PromptResult | Awaitable[PromptResult]]
 
+    _required_names: frozenset[str] = PrivateAttr(default=frozenset())
+    _context_kwarg: str | None = PrivateAttr(default=None)
+    _is_async: bool | None = PrivateAttr(default=None)
+    _takes_plain_strings: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._precompute()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _PRECOMPUTED_FROM_FIELDS:
+            self._precompute()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update and not _PRECOMPUTED_FROM_FIELDS.isdisjoint(update):
+            copied._precompute()
+        return copied
+
+    def _precompute(self) -> None:
+        # These only depend on fn and arguments, so work them out when those
+        # are set rather than on every render
+        self._required_names = frozenset(
+            arg.name for arg in self.arguments or () if arg.required
+        )
+        self._context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=_context_type())
+        self._is_async = _returns_awaitable(self.fn)
+        self._takes_plain_strings = _takes_plain_strings(self.fn)
+
     @classmethod
     def from_function(
         cls,
@@ -138,67 +419,29 @@ class FunctionPrompt(Prompt):
         The function can return:
         - A string (converted to a message)
         - A Message object
-        - A dict (converted to a message)
+        - A dict (a valid PromptMessage dict with a role and content is used as
+          that message, any other dict is serialized to JSON as a text message)
         - A sequence of any of the above
         """
-        from fastmcp.server.context import Context
-
-        func_name = name or getattr(fn, "__name__", None) or fn.__class__.__name__
+        try:
+            hash(fn)
+        except TypeError:
+            # fn can't be cached, e.g. an instance of a non-frozen dataclass
+            introspected = _introspect_fn.__wrapped__(fn)
+        else:
+            introspected = _introspect_fn(fn)
 
+        func_name = name or introspected.func_name
         if func_name == "<lambda>":
             raise ValueError("You must provide a name for lambda functions")
-            # Reject functions with *args or **kwargs
-        sig = inspect.signature(fn)
-        for param in sig.parameters.values():
-            if param.kind == inspect.Parameter.VAR_POSITIONAL:
-                raise ValueError("Functions with *args are not supported as prompts")
-            if param.kind == inspect.Parameter.VAR_KEYWORD:
-                raise ValueError("Functions with **kwargs are not supported as prompts")
-
-        description = description or inspect.getdoc(fn)
-
-        # if the fn is a callable class, we need to get the __call__ method from here out
-        if not inspect.isroutine(fn):
-            fn = fn.__call__
-        # if the fn is a staticmethod, we need to work with the underlying function
-        if isinstance(fn, staticmethod):
-            fn = fn.__func__
-
-        type_adapter = get_cached_typeadapter(fn)
-        parameters = type_adapter.json_schema()
-
-        # Auto-detect context parameter if not provided
-
-        context_kwarg = find_kwarg_by_type(fn, kwarg_type=Context)
-        if context_kwarg:
-            prune_params = [context_kwarg]
-        else:
-            prune_params = None
-
-        parameters = compress_schema(parameters, prune_params=prune_params)
-
-        # Convert parameters to PromptArguments
-        arguments: list[PromptArgument] = []
-        if "properties" in parameters:
-            for param_name, param in parameters["properties"].items():
-                arguments.append(
-                    PromptArgument(
-                        name=param_name,
-                        description=param.get("description"),
-                        required=param_name in parameters.get("required", []),
-                    )
-                )
-
-        # ensure the arguments are properly cast
-        fn = validate_call(fn)
 
         return cls(
             name=func_name,
-            description=description,
-            arguments=arguments,
+            description=description or introspected.description,
+            arguments=introspected.arguments,
             tags=tags or set(),
             enabled=enabled if enabled is not None else True,
-            fn=fn,
+            fn=_unwrap_fn(fn),
         )
 
     async def render(
@@ -206,57 +449,67 @@ class FunctionPrompt(Prompt):
         arguments: dict[str, Any] | None = None,
     ) -> list[PromptMessage]:
         """Render the prompt with arguments."""
-        from fastmcp.server.context import Context
-
         # Validate required arguments
-        if self.arguments:
-            required = {arg.name for arg in self.arguments if arg.required}
-            provided = set(arguments or {})
-            missing = required - provided
+        if self._required_names:
+            missing = self._required_names.difference(arguments or ())
             if missing:
-                raise ValueError(f"Missing required arguments: {missing}")
+                raise ValueError(f"Missing required arguments: {set(missing)}")
 
         try:
-            # Prepare arguments with context
-            kwargs = arguments.copy() if arguments else {}
-            context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
+            # Prepare arguments with context, only copying them when the
+            # context needs to be injected
+            kwargs = arguments or {}
+            context_kwarg = self._context_kwarg
             if context_kwarg and context_kwarg not in kwargs:
-                kwargs[context_kwarg] = get_context()
-
-            # Call function and check if result is a coroutine
-            result = self.fn(**kwargs)
-            if inspect.iscoroutine(result):
+                kwargs = kwargs | {context_kwarg: get_context()}
+
+            # The MCP protocol types prompt arguments as strings, and the server
+            # has already parsed them from the request, so when the function
+            # only takes plain strings there is nothing left to validate.
+            # Otherwise, call it through its cached type adapter, which casts
+            # the arguments and returns a coroutine for async functions.
+            if self._takes_plain_strings and all(
+                type(value) is str for value in kwargs.values()
+            ):
+                result = self.fn(**kwargs)
+            else:
+                type_adapter = get_cached_typeadapter(self.fn)
+                result = type_adapter.validate_python(kwargs)
+            if self._is_async or (
+                self._is_async is None and inspect.iscoroutine(result)
+            ):
                 result = await result
 
-            # Validate messages
+            # Convert result to messages, naming the item that couldn't be
+            # converted in the error. A single message is converted directly.
+            get_converter = _MESSAGE_CONVERTERS.get
+            converter = get_converter(type(result))
+            if converter is None and inspect.iscoroutine(result):
+                # A plain function can still return a coroutine, e.g. by
+                # calling an async helper, so await it rather than convert it
+                result = await result
+                converter = get_converter(type(result))
             if not isinstance(result, list | tuple):
-                result = [result]
-
-            # Convert result to messages
-            messages: list[PromptMessage] = []
-            for msg in result:
                 try:
-                    if isinstance(msg, PromptMessage):
-                        messages.append(msg)
-                    elif isinstance(msg, str):
-                        messages.append(
-                            PromptMessage(
-                                role="user",
-                                content=TextContent(type="text", text=msg),
-                            )
-                        )
-                    else:
-                        content = pydantic_core.to_json(
-                            msg, fallback=str, indent=2
-                        ).decode()
-                        messages.append(
-                            PromptMessage(
-                                role="user",
-                                content=TextContent(type="text", text=content),
-                            )
-                        )
-                except Exception:
-                    raise PromptError("Could not convert prompt result to message.")
+                    return [(converter or _convert_to_message)(result)]
+                except Exception as e:
+                    raise PromptError(
+                        f"Could not convert {type(result).__name__} result: {e}"
+                    ) from e
+
+            # Prompts can return many messages, so the names used in the loop
+            # are bound to locals up front, and a single handler around the
+            # loop finds the failing item from the messages converted so far
+            messages: list[PromptMessage] = []
+            append = messages.append
+            try:
+                for msg in result:
+                    append(get_converter(type(msg), _convert_to_message)(msg))
+            except Exception as e:
+                raise PromptError(
+                    f"Could not convert message {len(messages)} "
+                    f"({type(result[len(messages)]).__name__}): {e}"
+                ) from e
 
             return messages
         except Exception as e:
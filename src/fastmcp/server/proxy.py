@@ -356,14 +356,14 @@ class ProxyPrompt(Prompt):
         cls, client: Client, mcp_prompt: mcp.types.Prompt
     ) -> ProxyPrompt:
         """Factory method to create a ProxyPrompt from a raw MCP prompt schema."""
-        arguments = [
+        arguments = tuple(
             PromptArgument(
                 name=arg.name,
                 description=arg.description,
                 required=arg.required or False,
             )
             for arg in mcp_prompt.arguments or []
-        ]
+        )
         return cls(
             client=client,
             name=mcp_prompt.name,
@@ -550,7 +550,10 @@ class FastMCP(Generic[LifespanResultT]):
 
         with fastmcp.server.context.Context(fastmcp=self):
             prompts = await self._list_prompts()
-            return [prompt.to_mcp_prompt(name=prompt.key) for prompt in prompts]
+            return [
+                prompt._to_listed_mcp_prompt(name=prompt.key)  # type: ignore[reportPrivateUsage]
+                for prompt in prompts
+            ]
 
     async def _list_prompts(self) -> list[Prompt]:
         """
@@ -8,6 +8,7 @@ from functools import lru_cache
 from pathlib import Path
 from types import UnionType
 from typing import Annotated, TypeAlias, TypeVar, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
 
 from mcp.types import (
     Annotations,
@@ -74,17 +75,36 @@ def is_class_member_of_type(cls: type, base: type) -> bool:
         return issubclass_safe(cls, base)
 
 
+_kwarg_by_type_cache: WeakKeyDictionary[Callable, dict[type, str | None]] = (
+    WeakKeyDictionary()
+)
+
+
 def find_kwarg_by_type(fn: Callable, kwarg_type: type) -> str | None:
     """
     Find the name of the kwarg that is of type kwarg_type.
 
     Includes union types that contain the kwarg_type, as well as Annotated types.
+
+    Results are cached per function, as inspecting a signature is relatively
+    expensive and this is called whenever a component runs.
     """
     if inspect.ismethod(fn) and hasattr(fn, "__func__"):
-        sig = inspect.signature(fn.__func__)
-    else:
-        sig = inspect.signature(fn)
+        fn = fn.__func__
+
+    try:
+        cache = _kwarg_by_type_cache.setdefault(fn, {})
+    except TypeError:
+        # fn can't be weakly referenced or hashed, e.g. a builtin
+        return _find_kwarg_by_type(fn, kwarg_type)
+
+    if kwarg_type not in cache:
+        cache[kwarg_type] = _find_kwarg_by_type(fn, kwarg_type)
+    return cache[kwarg_type]
+
 
+def _find_kwarg_by_type(fn: Callable, kwarg_type: type) -> str | None:
+    sig = inspect.signature(fn)
     for name, param in sig.parameters.items():
         if is_class_member_of_type(param.annotation, kwarg_type):
             return name
@@ -1,10 +1,17 @@
+import dataclasses
+import enum
+import functools
+
 import pytest
-from mcp.types import EmbeddedResource, TextResourceContents
-from pydantic import FileUrl
+from mcp.types import EmbeddedResource, ImageContent, TextResourceContents
+from pydantic import Field, FileUrl, ValidationError
 
+import fastmcp.prompts.prompt as prompt_module
+from fastmcp.exceptions import PromptError
 from fastmcp.prompts.prompt import (
     Message,
     Prompt,
+    PromptArgument,
     PromptMessage,
     TextContent,
 )
@@ -33,6 +40,76 @@ class TestRenderPrompt:
             )
         ]
 
+    async def test_sync_wrapper_returning_coroutine(self):
+        async def greet() -> str:
+            return "Hello, world!"
+
+        @functools.wraps(greet)
+        def fn():
+            return greet()
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="Hello, world!")
+            )
+        ]
+
+    async def test_reassigned_arguments_are_checked(self):
+        def fn(x: str | None = None) -> str:
+            return f"Hello, {x}!"
+
+        prompt = Prompt.from_function(fn)
+        prompt.arguments = (PromptArgument(name="x", required=True),)
+        with pytest.raises(ValueError, match="Missing required arguments"):
+            await prompt.render()
+
+    async def test_copy_with_new_fn_is_rendered_with_it(self):
+        async def fn() -> str:
+            return "Hello, world!"
+
+        def other_fn() -> str:
+            return "Goodbye, world!"
+
+        prompt = Prompt.from_function(fn)
+        copied = prompt.model_copy(update={"fn": other_fn})
+        assert await copied.render() == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="Goodbye, world!")
+            )
+        ]
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="Hello, world!")
+            )
+        ]
+
+    async def test_plain_fn_returning_coroutine(self):
+        async def greet() -> str:
+            return "Hello, world!"
+
+        def fn():
+            return greet()
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="Hello, world!")
+            )
+        ]
+
+    async def test_plain_fn_returning_list_of_coroutines(self, caplog):
+        async def greet() -> str:
+            return "Hello, world!"
+
+        def fn():
+            return ["Hello!", greet()]
+
+        prompt = Prompt.from_function(fn)
+        with pytest.raises(PromptError):
+            await prompt.render()
+        assert "Could not convert message 1 (coroutine)" in caplog.text
+
     async def test_fn_with_args(self):
         async def fn(name: str, age: int = 30) -> str:
             return f"Hello, {name}! You're {age} years old."
@@ -47,6 +124,40 @@ class TestRenderPrompt:
             )
         ]
 
+    async def test_fn_args_are_cast(self):
+        def fn(name: str, age: int = 30) -> str:
+            assert isinstance(age, int)
+            return f"Hello, {name}! You're {age} years old."
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render(arguments=dict(name="World", age="40")) == [
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text", text="Hello, World! You're 40 years old."
+                ),
+            )
+        ]
+
+    async def test_fn_with_field_default(self):
+        def fn(name: str = Field(default="World", description="Who to greet")) -> str:
+            return f"Hello, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="Hello, World!")
+            )
+        ]
+
+    async def test_fn_with_string_args_rejects_other_types(self):
+        def fn(name: str) -> str:
+            return f"Hello, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        with pytest.raises(PromptError):
+            await prompt.render(arguments={"name": 42})
+
     async def test_callable_object(self):
         class MyPrompt:
             def __call__(self, name: str) -> str:
@@ -71,6 +182,45 @@ class TestRenderPrompt:
             )
         ]
 
+    async def test_unhashable_callable_object(self):
+        @dataclasses.dataclass
+        class Greeter:
+            greeting: str = "hi"
+
+            def __call__(self, name: str) -> str:
+                return f"{self.greeting} {name}"
+
+        prompt = Prompt.from_function(Greeter(), name="g")
+        assert await prompt.render(arguments={"name": "x"}) == [
+            PromptMessage(role="user", content=TextContent(type="text", text="hi x"))
+        ]
+
+    async def test_equal_callable_objects_use_their_own_instance(self):
+        @dataclasses.dataclass(frozen=True)
+        class Greeter:
+            greeting: str
+            client: str = dataclasses.field(compare=False)
+
+            def __call__(self, name: str) -> str:
+                return f"{self.greeting} {name} via {self.client}"
+
+        first = Greeter("hi", "c1")
+        second = Greeter("hi", "c2")
+        assert first == second
+
+        first_prompt = Prompt.from_function(first, name="first")
+        second_prompt = Prompt.from_function(second, name="second")
+        assert await first_prompt.render(arguments={"name": "x"}) == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="hi x via c1")
+            )
+        ]
+        assert await second_prompt.render(arguments={"name": "x"}) == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="hi x via c2")
+            )
+        ]
+
     async def test_fn_with_invalid_kwargs(self):
         async def fn(name: str, age: int = 30) -> str:
             return f"Hello, {name}! You're {age} years old."
@@ -136,6 +286,112 @@ class TestRenderPrompt:
             for t in expected
         ]
 
+    async def test_fn_returns_list_of_objects(self):
+        async def fn() -> list[dict]:
+            return [{"a": 1}, {"b": [1, 2]}]
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text='{"a":1}')
+            ),
+            PromptMessage(
+                role="user", content=TextContent(type="text", text='{"b":[1,2]}')
+            ),
+        ]
+
+    async def test_fn_returns_dict_with_floats(self):
+        async def fn() -> dict:
+            return {"nan": float("nan"), "big": 1e20}
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user",
+                content=TextContent(type="text", text='{"nan":NaN,"big":1e20}'),
+            )
+        ]
+
+    async def test_fn_returns_message_dict(self):
+        async def fn() -> list[dict]:
+            return [
+                {"role": "assistant", "content": {"type": "text", "text": "Hi!"}},
+                {"role": "user", "text": "not a message"},
+            ]
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="assistant", content=TextContent(type="text", text="Hi!")
+            ),
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text", text='{"role":"user","text":"not a message"}'
+                ),
+            ),
+        ]
+
+    async def test_fn_returns_invalid_message_dict(self):
+        async def fn() -> list[dict]:
+            return [
+                {"role": "user", "content": "hello"},
+                {"role": "system", "content": {"type": "text", "text": "Hi!"}},
+            ]
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text", text='{"role":"user","content":"hello"}'
+                ),
+            ),
+            PromptMessage(
+                role="user",
+                content=TextContent(
+                    type="text",
+                    text='{"role":"system","content":{"type":"text","text":"Hi!"}}',
+                ),
+            ),
+        ]
+
+    async def test_fn_returns_subclasses(self):
+        class Greeting(str):
+            pass
+
+        class CustomMessage(PromptMessage):
+            pass
+
+        custom = CustomMessage(
+            role="assistant", content=TextContent(type="text", text="Hi!")
+        )
+
+        async def fn() -> list[str | PromptMessage]:
+            return [Greeting("Hello, world!"), custom]
+
+        prompt = Prompt.from_function(fn)
+        assert await prompt.render() == [
+            PromptMessage(
+                role="user", content=TextContent(type="text", text="Hello, world!")
+            ),
+            custom,
+        ]
+
+    async def test_fn_returns_str_enum(self):
+        class Color(str, enum.Enum):
+            RED = "red"
+
+        async def fn() -> str:
+            return Color.RED
+
+        prompt = Prompt.from_function(fn)
+        messages = await prompt.render()
+        assert messages == [
+            PromptMessage(role="user", content=TextContent(type="text", text="red"))
+        ]
+        assert type(messages[0].content.text) is str
+
     async def test_fn_returns_resource_content(self):
         """Test returning a message with resource content."""
 
@@ -240,3 +496,173 @@ class TestRenderPrompt:
                 ),
             )
         ]
+
+
+class TestMessage:
+    def test_string_content(self):
+        message = Message("Hello, world!")
+        assert message == PromptMessage(
+            role="user", content=TextContent(type="text", text="Hello, world!")
+        )
+        assert (
+            message.model_dump()
+            == PromptMessage(
+                role="user", content=TextContent(type="text", text="Hello, world!")
+            ).model_dump()
+        )
+
+    def test_content_object(self):
+        content = ImageContent(type="image", data="abc", mimeType="image/png")
+        message = Message(content, role="assistant")
+        assert message == PromptMessage(role="assistant", content=content)
+        assert message.content is content
+
+    def test_content_dict_is_validated(self):
+        message = Message({"type": "text", "text": "Hi!"})  # type: ignore[arg-type]
+        assert message == PromptMessage(
+            role="user", content=TextContent(type="text", text="Hi!")
+        )
+
+    def test_invalid_role_is_validated(self):
+        with pytest.raises(ValidationError):
+            Message("Hello, world!", role="system")  # type: ignore[arg-type]
+
+    def test_untrusted_text_message_is_validated(self, monkeypatch):
+        monkeypatch.setattr(prompt_module, "_TRUST_INTERNAL", False)
+        text_message = prompt_module._text_message  # type: ignore[reportPrivateUsage]
+        with pytest.raises(ValidationError):
+            text_message("Hello, world!", role="system")  # type: ignore[arg-type]
+
+    def test_untrusted_content_object_is_validated(self, monkeypatch):
+        validated = []
+        original_message_validator = prompt_module.message_validator
+
+        class MessageValidator:
+            def validate_python(self, obj):
+                validated.append(obj)
+                return original_message_validator.validate_python(obj)
+
+        monkeypatch.setattr(prompt_module, "_TRUST_INTERNAL", False)
+        monkeypatch.setattr(prompt_module, "message_validator", MessageValidator())
+
+        content = ImageContent(type="image", data="abc", mimeType="image/png")
+        assert Message(content, role="assistant") == PromptMessage(
+            role="assistant", content=content
+        )
+        assert validated == [{"content": content, "role": "assistant"}]
+
+
+class TestFromFunction:
+    def test_reregistering_fn_keeps_overrides(self):
+        def fn(name: str) -> str:
+            """Greet someone."""
+            return f"Hello, {name}!"
+
+        first = Prompt.from_function(fn)
+        second = Prompt.from_function(fn, name="greet", description="Say hi")
+
+        assert first.name == "fn"
+        assert first.description == "Greet someone."
+        assert second.name == "greet"
+        assert second.description == "Say hi"
+        assert first.arguments == second.arguments
+
+    def test_reregistering_fn_reuses_schema(self, monkeypatch):
+        def fn(name: str, greeting: str = "Hello") -> str:
+            return f"{greeting}, {name}!"
+
+        calls = []
+        original_compress_schema = prompt_module.compress_schema
+
+        def compress_schema(*args, **kwargs):
+            calls.append(args)
+            return original_compress_schema(*args, **kwargs)
+
+        monkeypatch.setattr(prompt_module, "compress_schema", compress_schema)
+
+        first = Prompt.from_function(fn)
+        second = Prompt.from_function(fn, name="greet")
+
+        assert len(calls) == 1
+        assert first.arguments is not None
+        assert second.arguments is not None
+        assert all(a is b for a, b in zip(first.arguments, second.arguments))
+
+    def test_arguments_are_a_tuple(self):
+        def fn(name: str, greeting: str = "Hello") -> str:
+            return f"{greeting}, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        assert prompt.arguments == (
+            PromptArgument(name="name", required=True),
+            PromptArgument(name="greeting", required=False),
+        )
+
+    def test_arguments_are_frozen(self):
+        argument = PromptArgument(name="name", required=True)
+
+        assert hash(argument) == hash(PromptArgument(name="name", required=True))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            argument.name = "other"  # type: ignore[misc]
+
+    def test_lambda_requires_name_when_cached(self):
+        fn = lambda: "Hello, world!"  # noqa: E731
+
+        Prompt.from_function(fn, name="hello")
+        with pytest.raises(ValueError, match="lambda"):
+            Prompt.from_function(fn)
+
+
+class TestToMCPPrompt:
+    def test_listed_mcp_prompt_is_cached(self):
+        def fn(name: str) -> str:
+            return f"Hello, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        listed = prompt._to_listed_mcp_prompt("fn")
+        assert listed is prompt._to_listed_mcp_prompt("fn")
+        assert prompt._to_listed_mcp_prompt("prefixed_fn").name == "prefixed_fn"
+
+    def test_to_mcp_prompt_returns_new_instance(self):
+        def fn(name: str) -> str:
+            return f"Hello, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        mcp_prompt = prompt.to_mcp_prompt()
+        assert mcp_prompt is not prompt.to_mcp_prompt()
+
+        mcp_prompt.arguments.clear()  # type: ignore[union-attr]
+        assert prompt._to_listed_mcp_prompt("fn").arguments
+
+    def test_to_mcp_prompt_with_overrides(self):
+        def fn(name: str) -> str:
+            return f"Hello, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        mcp_prompt = prompt.to_mcp_prompt(name="prefixed_fn")
+        assert mcp_prompt.name == "prefixed_fn"
+        assert prompt.to_mcp_prompt().name == "fn"
+
+    def test_to_mcp_prompt_validates_overrides(self):
+        def fn(name: str) -> str:
+            return f"Hello, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        with pytest.raises(ValidationError):
+            prompt.to_mcp_prompt(name=123)
+
+    def test_to_mcp_prompt_reflects_updates(self):
+        def fn(name: str) -> str:
+            return f"Hello, {name}!"
+
+        prompt = Prompt.from_function(fn)
+        assert prompt.to_mcp_prompt().description is None
+
+        prompt.description = "Greet someone"
+        assert prompt.to_mcp_prompt().description == "Greet someone"
+
+        assert prompt._to_listed_mcp_prompt("fn").description == "Greet someone"
+
+        copied = prompt.model_copy(update={"name": "greet"})
+        assert copied._to_listed_mcp_prompt("greet").name == "greet"
+        assert prompt._to_listed_mcp_prompt("fn").name == "fn"
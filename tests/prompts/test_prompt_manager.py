@@ -397,6 +397,23 @@ class TestContextHandling:
         assert len(messages) == 1
         assert messages[0].content.text == "42"  # type: ignore[attr-defined]
 
+    async def test_context_injection_does_not_mutate_arguments(self):
+        def prompt_with_context(x: int, ctx: Context) -> str:
+            return str(x)
+
+        prompt = Prompt.from_function(prompt_with_context)
+
+        from fastmcp import FastMCP
+
+        mcp = FastMCP()
+        context = Context(fastmcp=mcp)
+        arguments = {"x": 42}
+
+        with context:
+            await prompt.render(arguments=arguments)
+
+        assert arguments == {"x": 42}
+
     async def test_context_optional(self):
         """Test that context is optional when rendering prompts."""
 
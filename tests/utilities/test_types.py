@@ -536,3 +536,25 @@ class TestFindKwargByType:
             pass
 
         assert find_kwarg_by_type(func, str) == "c"
+
+    def test_cached_results_are_per_type(self):
+        """Test that cached lookups for one type don't leak into another."""
+
+        def func(a: BaseClass, b: OtherClass):
+            pass
+
+        assert find_kwarg_by_type(func, BaseClass) == "a"
+        assert find_kwarg_by_type(func, OtherClass) == "b"
+        assert find_kwarg_by_type(func, BaseClass) == "a"
+
+    def test_callable_that_cannot_be_weakly_referenced(self):
+        """Test callables that can't be cached, like builtins."""
+
+        class Unhashable:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __call__(self, a: BaseClass):
+                pass
+
+        assert find_kwarg_by_type(Unhashable(), BaseClass) == "a"
+        assert find_kwarg_by_type(len, BaseClass) is None